@@ -0,0 +1,18 @@
+"""Shared pytest fixtures."""
+
+import glob
+import os
+
+import pytest
+
+TEST_DATA_DIR = os.path.join(os.path.dirname(__file__), "test_data")
+
+
+@pytest.fixture(scope="session")
+def qdimacs_contents():
+    """Return the contents of all test data files, keyed by relative path."""
+    contents = {}
+    for path in glob.glob(os.path.join(TEST_DATA_DIR, "*.*dimacs")):
+        with open(path) as file:
+            contents[os.path.join("test_data", os.path.basename(path))] = file.read()
+    return contents
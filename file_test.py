@@ -1,18 +1,12 @@
 """Tests for file reading and end-to-end functionality."""
 
-import os
-
 import parse
 import lib
 
 
-def test_read_satisfiable_tautology_file():
+def test_read_satisfiable_tautology_file(qdimacs_contents):
     """Test reading and parsing satisfiable tautology file."""
-    file_path = "test_data/satisfiable_tautology.qdimacs"
-    assert os.path.exists(file_path), f"Test file {file_path} not found"
-
-    with open(file_path, "r") as f:
-        content = f.read()
+    content = qdimacs_contents["test_data/satisfiable_tautology.qdimacs"]
 
     result = parse.from_qdimacs(content)
     expected = parse.QDimacs(
@@ -21,13 +15,9 @@ def test_read_satisfiable_tautology_file():
     assert result == expected
 
 
-def test_read_satisfiable_mixed_quantifiers_file():
+def test_read_satisfiable_mixed_quantifiers_file(qdimacs_contents):
     """Test reading and parsing satisfiable mixed quantifiers file."""
-    file_path = "test_data/satisfiable_mixed_quantifiers.qdimacs"
-    assert os.path.exists(file_path), f"Test file {file_path} not found"
-
-    with open(file_path, "r") as f:
-        content = f.read()
+    content = qdimacs_contents["test_data/satisfiable_mixed_quantifiers.qdimacs"]
 
     result = parse.from_qdimacs(content)
     expected = parse.QDimacs(
@@ -41,13 +31,9 @@ def test_read_satisfiable_mixed_quantifiers_file():
     assert result == expected
 
 
-def test_read_classic_qbf_example_file():
+def test_read_classic_qbf_example_file(qdimacs_contents):
     """Test reading and parsing classic QBF example file."""
-    file_path = "test_data/classic_qbf_example.qdimacs"
-    assert os.path.exists(file_path), f"Test file {file_path} not found"
-
-    with open(file_path, "r") as f:
-        content = f.read()
+    content = qdimacs_contents["test_data/classic_qbf_example.qdimacs"]
 
     result = parse.from_qdimacs(content)
     expected = parse.QDimacs(
@@ -61,13 +47,9 @@ def test_read_classic_qbf_example_file():
     assert result == expected
 
 
-def test_read_unsatisfiable_example_file():
+def test_read_unsatisfiable_example_file(qdimacs_contents):
     """Test reading and parsing unsatisfiable example file."""
-    file_path = "test_data/unsatisfiable_example.qdimacs"
-    assert os.path.exists(file_path), f"Test file {file_path} not found"
-
-    with open(file_path, "r") as f:
-        content = f.read()
+    content = qdimacs_contents["test_data/unsatisfiable_example.qdimacs"]
 
     result = parse.from_qdimacs(content)
     expected = parse.QDimacs(
@@ -81,13 +63,9 @@ def test_read_unsatisfiable_example_file():
     assert result == expected
 
 
-def test_read_complex_alternating_file():
+def test_read_complex_alternating_file(qdimacs_contents):
     """Test reading and parsing complex alternating quantifiers file."""
-    file_path = "test_data/complex_alternating.qdimacs"
-    assert os.path.exists(file_path), f"Test file {file_path} not found"
-
-    with open(file_path, "r") as f:
-        content = f.read()
+    content = qdimacs_contents["test_data/complex_alternating.qdimacs"]
 
     result = parse.from_qdimacs(content)
     expected = parse.QDimacs(
@@ -103,13 +81,9 @@ def test_read_complex_alternating_file():
     assert result == expected
 
 
-def test_read_large_formula_file():
+def test_read_large_formula_file(qdimacs_contents):
     """Test reading and parsing large formula file."""
-    file_path = "test_data/large_formula.qdimacs"
-    assert os.path.exists(file_path), f"Test file {file_path} not found"
-
-    with open(file_path, "r") as f:
-        content = f.read()
+    content = qdimacs_contents["test_data/large_formula.qdimacs"]
 
     result = parse.from_qdimacs(content)
     expected = parse.QDimacs(
@@ -123,78 +97,55 @@ def test_read_large_formula_file():
     assert result == expected
 
 
-def test_solve_file_satisfiable_tautology():
-    """Test solving satisfiable tautology file (currently returns UNSAT due to placeholder)."""
-    file_path = "test_data/satisfiable_tautology.qdimacs"
-    assert os.path.exists(file_path), f"Test file {file_path} not found"
-
-    with open(file_path, "r") as f:
-        content = f.read()
+def test_solve_file_satisfiable_tautology(qdimacs_contents):
+    """Test solving the satisfiable tautology file."""
+    content = qdimacs_contents["test_data/satisfiable_tautology.qdimacs"]
 
     result = lib.solve_file(content)
     assert isinstance(result, str)
     assert result == "SAT"
 
 
-def test_solve_file_satisfiable_mixed():
-    """Test solving satisfiable mixed quantifiers file (currently returns UNSAT due to placeholder)."""
-    file_path = "test_data/satisfiable_mixed_quantifiers.qdimacs"
-    assert os.path.exists(file_path), f"Test file {file_path} not found"
-
-    with open(file_path, "r") as f:
-        content = f.read()
+def test_solve_file_satisfiable_mixed(qdimacs_contents):
+    """Test solving the satisfiable mixed quantifiers file."""
+    content = qdimacs_contents["test_data/satisfiable_mixed_quantifiers.qdimacs"]
 
     result = lib.solve_file(content)
     assert isinstance(result, str)
     assert result == "SAT"
 
 
-def test_solve_file_unsatisfiable():
-    """Test solving unsatisfiable file (currently returns UNSAT, which happens to be correct)."""
-    file_path = "test_data/unsatisfiable_example.qdimacs"
-    assert os.path.exists(file_path), f"Test file {file_path} not found"
-
-    with open(file_path, "r") as f:
-        content = f.read()
+def test_solve_file_unsatisfiable(qdimacs_contents):
+    """Test solving the unsatisfiable file."""
+    # For either value of x, the clauses force y to be both true and false.
+    content = qdimacs_contents["test_data/unsatisfiable_example.qdimacs"]
 
     result = lib.solve_file(content)
     assert isinstance(result, str)
     assert result == "UNSAT"
 
 
-def test_read_classical_sat_satisfiable_file():
+def test_read_classical_sat_satisfiable_file(qdimacs_contents):
     """Test reading and parsing classical SAT satisfiable file."""
-    file_path = "test_data/classical_sat_satisfiable.dimacs"
-    assert os.path.exists(file_path), f"Test file {file_path} not found"
-
-    with open(file_path, "r") as f:
-        content = f.read()
+    content = qdimacs_contents["test_data/classical_sat_satisfiable.dimacs"]
 
     result = parse.from_qdimacs(content)
     expected = parse.QDimacs(1, [[1]], [])  # No quantifiers in classical SAT
     assert result == expected
 
 
-def test_read_classical_sat_unsatisfiable_file():
+def test_read_classical_sat_unsatisfiable_file(qdimacs_contents):
     """Test reading and parsing classical SAT unsatisfiable file."""
-    file_path = "test_data/classical_sat_unsatisfiable.dimacs"
-    assert os.path.exists(file_path), f"Test file {file_path} not found"
-
-    with open(file_path, "r") as f:
-        content = f.read()
+    content = qdimacs_contents["test_data/classical_sat_unsatisfiable.dimacs"]
 
     result = parse.from_qdimacs(content)
     expected = parse.QDimacs(1, [[1], [-1]], [])  # No quantifiers in classical SAT
     assert result == expected
 
 
-def test_read_classical_sat_complex_file():
+def test_read_classical_sat_complex_file(qdimacs_contents):
     """Test reading and parsing complex classical SAT file."""
-    file_path = "test_data/classical_sat_complex.dimacs"
-    assert os.path.exists(file_path), f"Test file {file_path} not found"
-
-    with open(file_path, "r") as f:
-        content = f.read()
+    content = qdimacs_contents["test_data/classical_sat_complex.dimacs"]
 
     result = parse.from_qdimacs(content)
     expected = parse.QDimacs(
@@ -203,26 +154,19 @@ def test_read_classical_sat_complex_file():
     assert result == expected
 
 
-def test_solve_classical_sat_satisfiable():
-    """Test solving classical SAT satisfiable file (currently returns UNSAT due to placeholder)."""
-    file_path = "test_data/classical_sat_satisfiable.dimacs"
-    assert os.path.exists(file_path), f"Test file {file_path} not found"
-
-    with open(file_path, "r") as f:
-        content = f.read()
+def test_solve_classical_sat_satisfiable(qdimacs_contents):
+    """Test solving the satisfiable classical SAT file."""
+    content = qdimacs_contents["test_data/classical_sat_satisfiable.dimacs"]
 
     result = lib.solve_file(content)
     assert isinstance(result, str)
     assert result == "SAT"
 
 
-def test_solve_classical_sat_unsatisfiable():
-    """Test solving classical SAT unsatisfiable file (currently returns UNSAT, which happens to be correct)."""
-    file_path = "test_data/classical_sat_unsatisfiable.dimacs"
-    assert os.path.exists(file_path), f"Test file {file_path} not found"
-
-    with open(file_path, "r") as f:
-        content = f.read()
+def test_solve_classical_sat_unsatisfiable(qdimacs_contents):
+    """Test solving the unsatisfiable classical SAT file."""
+    # x1 ∧ ¬x1 is a contradiction.
+    content = qdimacs_contents["test_data/classical_sat_unsatisfiable.dimacs"]
 
     result = lib.solve_file(content)
     assert isinstance(result, str)
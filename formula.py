@@ -3,103 +3,148 @@
 from typing import List, Dict, Set, Sequence, FrozenSet, Iterable
 from dataclasses import dataclass, field
 import itertools
-import functools
 import parse
 
 VariableIndex = int
 ClauseIndex = int
+# Literals are signed variable indices, as in QDIMACS.
+LiteralIndex = int
 
 QuantifierType = parse.QuantifierType
 
+# Clauses whose variables all have an index up to this bound additionally
+# carry a bitmask of their literals.
+MAX_MASK_VARIABLE = 512
+# In a literal mask, bit v stands for literal v and bit _NEGATIVE_SHIFT + v
+# for literal -v.
+_NEGATIVE_SHIFT = MAX_MASK_VARIABLE + 1
+_POSITIVE_BITS = (1 << _NEGATIVE_SHIFT) - 1
 
-@dataclass(frozen=True)
-class Literal:
-    """Represents a literal in a QBF formula."""
 
-    variable: VariableIndex
-    is_positive: bool
-    occurrences: Set["Clause"] = field(
-        default_factory=set
-    )  # notably, occurence set is not frozen
+class Literal(int):
+    """Represents a literal in a QBF formula by its signed QDIMACS index.
 
-    def __post_init__(self):
-        """Initialize the occurrences set."""
+    Formulas store literals as plain ints; this subclass only adds a
+    readable constructor and accessors. Negation is integer negation."""
 
-    def literal_index(self) -> int:
-        """Return the index of this literal in the formula."""
-        return self.variable if self.is_positive else -self.variable
+    __slots__ = ()
 
-    def __eq__(self, value):
-        """Return whether this literal is equal to another."""
-        if not isinstance(value, Literal):
-            return False
-        return self.variable == value.variable and self.is_positive == value.is_positive
+    def __new__(cls, variable: VariableIndex, is_positive: bool):
+        """Create the literal of the given variable and polarity."""
+        return super().__new__(cls, variable if is_positive else -variable)
 
-    def __hash__(self):
-        """Return the hash of this literal."""
-        return hash((self.variable, self.is_positive))
+    @property
+    def variable(self) -> VariableIndex:
+        """Return the variable of this literal."""
+        return abs(self)
+
+    @property
+    def is_positive(self) -> bool:
+        """Return whether this is a positive literal."""
+        return self > 0
 
-    # TODO(markus): is this a good idea? Will lead to duplicate literal objects.
-    def __neg__(self):
-        """Return the negation of this literal."""
-        return Literal(self.variable, not self.is_positive)
+    def literal_index(self) -> LiteralIndex:
+        """Return the index of this literal in the formula."""
+        return int(self)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Variable:
     """Represents a variable in a QBF formula."""
 
     index: VariableIndex
     quantifier: QuantifierType
-    positive: Literal = field(init=False)
-    negative: Literal = field(init=False)
-    # Universal variables that this variable depends on (i.e. universal
-    # quantifiers that are quantified at a lower level)
-    dependencies: Set["Variable"] = field(default_factory=set)
+    positive: LiteralIndex = field(init=False)
+    negative: LiteralIndex = field(init=False)
+    # Index of the quantifier block binding this variable; free variables are
+    # outermost. The variable depends on the universals at lower levels.
+    level: int = -1
 
     def __post_init__(self):
         """Initialize the positive and negative literals."""
-        object.__setattr__(self, "positive", Literal(self.index, True))
-        object.__setattr__(self, "negative", Literal(self.index, False))
+        object.__setattr__(self, "positive", self.index)
+        object.__setattr__(self, "negative", -self.index)
 
-    def get_literal(self, is_positive: bool) -> Literal:
+    def get_literal(self, is_positive: bool) -> LiteralIndex:
         """Return the positive or negative literal for this variable."""
         return self.positive if is_positive else self.negative
 
+    def depends_on(self, variable: "Variable") -> bool:
+        """Return whether this variable depends on the given universal."""
+        return (
+            variable.quantifier is QuantifierType.FORALL and variable.level < self.level
+        )
+
     def __hash__(self):
         """Return the hash of this variable."""
         return hash(self.index)
 
     def __eq__(self, value):
         """Return whether this variable is equal to another."""
+        if self is value:
+            return True
         if not isinstance(value, Variable):
             return False
         return self.index == value.index
 
 
 # Try to not create clauses other than through the Formula class.
-@dataclass(frozen=True)  # frozen to allow it to be used in a set
+@dataclass(frozen=True, slots=True)  # frozen to allow it to be used in a set
 class Clause:
     """Represents a clause in a QBF formula."""
 
-    literals: FrozenSet[Literal]
+    literals: FrozenSet[LiteralIndex]
     index: ClauseIndex | None = None
     is_original: bool = False
+    _hash: int = field(init=False, repr=False, compare=False)
+    _is_tautology: bool = field(init=False, repr=False, compare=False)
+    # Bitmask of the literals, see _NEGATIVE_SHIFT. None if a variable index
+    # exceeds MAX_MASK_VARIABLE.
+    _literal_mask: int | None = field(init=False, repr=False, compare=False)
+    # 64-bit Bloom filter of the literals: bit (literal & 63) is set for each
+    # literal. A subset's signature is contained in the superset's signature.
+    # Only needed for clauses without a literal mask; computed on first use.
+    _signature: int | None = field(init=False, repr=False, compare=False)
+    # QDIMACS representation, computed on first use.
+    _qdimacs: str | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Compute derived properties once; literals never change."""
+        # Consistent with __eq__, which compares the literal sets.
+        object.__setattr__(self, "_hash", hash(self.literals))
+        literal_mask = 0
+        for l in self.literals:
+            if not -MAX_MASK_VARIABLE <= l <= MAX_MASK_VARIABLE:
+                literal_mask = None
+                break
+            literal_mask |= 1 << (l if l > 0 else _NEGATIVE_SHIFT - l)
+        if literal_mask is None:
+            is_tautology = any(-l in self.literals for l in self.literals)
+        else:
+            positive_mask = literal_mask & _POSITIVE_BITS
+            is_tautology = positive_mask & (literal_mask >> _NEGATIVE_SHIFT) != 0
+        object.__setattr__(self, "_literal_mask", literal_mask)
+        object.__setattr__(self, "_is_tautology", is_tautology)
+        object.__setattr__(self, "_signature", None)
+        object.__setattr__(self, "_qdimacs", None)
 
     @staticmethod
     def from_literals(
-        literals: Sequence[Literal], index: ClauseIndex, is_original: bool = False
+        literals: Iterable[LiteralIndex], index: ClauseIndex, is_original: bool = False
     ) -> "Clause":
         """Create a clause from a list of literals."""
         return Clause(frozenset(literals), index, is_original)
 
     def __hash__(self):
         """Return the hash of this clause."""
-        return hash(frozenset(l.literal_index() for l in self.literals))
+        return self._hash
 
     def __eq__(self, other):
         """Return whether this clause is equal to another."""
-        if not isinstance(other, Clause):
+        if self is other:
+            return True
+        # Unequal hashes rule out equal literal sets without comparing them.
+        if not isinstance(other, Clause) or self._hash != other._hash:
             return False
         return self.literals == other.literals
 
@@ -109,15 +154,34 @@ class Clause:
 
     def to_qdimacs(self) -> str:
         """Return a string representation of this clause in QDIMACS format."""
-        clause_str = " ".join(str(l.literal_index()) for l in self.literals) + " 0"
-        comment = (
-            f"c Clause {self.index}, {'original' if self.is_original else 'derived'}"
-        )
-        return f"{comment}\n{clause_str}"
+        if self._qdimacs is None:
+            # Sorted, so that the output doesn't depend on set iteration order.
+            clause_str = " ".join(map(str, sorted(self.literals))) + " 0"
+            origin = "original" if self.is_original else "derived"
+            comment = f"c Clause {self.index}, {origin}"
+            object.__setattr__(self, "_qdimacs", f"{comment}\n{clause_str}")
+        return self._qdimacs
+
+    def signature(self) -> int:
+        """Return the signature of this clause, see _signature."""
+        if self._signature is None:
+            signature = 0
+            for l in self.literals:
+                signature |= 1 << (l & 63)
+            object.__setattr__(self, "_signature", signature)
+        return self._signature
 
     def is_tautology(self) -> bool:
         """Return whether this clause is a tautology."""
-        return any(-l in self.literals for l in self.literals)
+        return self._is_tautology
+
+
+def _resolvent_literals(
+    clause1: Clause, clause2: Clause, variable: Variable
+) -> FrozenSet[LiteralIndex]:
+    """Return the literals of the resolvent of two clauses on a variable."""
+    pivot_literals = {variable.positive, variable.negative}
+    return (clause1.literals | clause2.literals) - pivot_literals
 
 
 class Formula:
@@ -125,41 +189,92 @@ class Formula:
 
     Represents a QBF formula as a graph of variables and clauses."""
 
+    __slots__ = (
+        "quantifiers",
+        "variables_by_index",
+        "clauses",
+        "clauses_by_index",
+        "occurrences",
+        "occurrences_by_len",
+        "_occurrence_counts",
+        "_next_variable_index",
+        "_next_clause_index",
+        "_empty_clause",
+        "_has_empty_clause",
+        "_variable_levels",
+        "_universal_variables",
+        "_universal_literal_mask",
+    )
+
     def __init__(self, qdimacs: parse.QDimacs):
         self.quantifiers: List[parse.QuantifierBlock] = qdimacs.quantifiers
-        self.variables_by_index: Dict[VariableIndex, Variable] = {}
         self.clauses: Set[Clause] = set()
         self.clauses_by_index: Dict[ClauseIndex, Clause] = {}
-
-        # Largest variable/clause index that MAY be in use.
-        # 0 is not a valid variable index.
-        self._largest_used_variable_index = 1
-        self._largest_used_clause_index = 0
-
-        universal_variables: Set[Variable] = set()
-        for quantifier in qdimacs.quantifiers:
-            for variable in quantifier.bound_variables:
-                if quantifier.is_forall():
-                    universal_variables.add(variable)
-                if quantifier.is_exists():
-                    self.create_fresh_variable(
-                        variable, quantifier.quantifier_type, universal_variables
-                    )
-                else:
-                    self.create_fresh_variable(variable, quantifier.quantifier_type)
-
-        for variable_index in range(1, qdimacs.num_vars + 1):
-            if variable_index not in self.variables_by_index:
-                # assuming that these variables are existential and can't depend on any universal variables
-                self.create_fresh_variable(variable_index)
-
-        for index, clause in enumerate(qdimacs.clauses):
-            for literal in clause:
-                var_index = abs(literal)
-                if var_index not in self.variables_by_index:
-                    self.create_fresh_variable(var_index)
-            clause = self.create_clause_from_qdimacs(clause, index)
-            self.add_clause(clause)
+        self._empty_clause: Clause | None = None
+        # Whether the empty clause is in the formula, kept up to date by
+        # add_clause and remove_clause.
+        self._has_empty_clause = False
+
+        # Quantifier level of every bound variable, and the universal ones,
+        # for universal reduction.
+        self._variable_levels: Dict[VariableIndex, int] = {}
+        self._universal_variables: Set[VariableIndex] = set()
+
+        # Build all variables in one pass over the prefix. Existentials
+        # depend on the universals quantified at lower levels.
+        variables: Dict[VariableIndex, Variable] = {}
+        for level, quantifier in enumerate(qdimacs.quantifiers):
+            is_forall = quantifier.is_forall()
+            for index in quantifier.bound_variables:
+                assert index not in variables
+                self._variable_levels[index] = level
+                if is_forall:
+                    self._universal_variables.add(index)
+                variables[index] = Variable(index, quantifier.quantifier_type, level)
+        # Unquantified variables, including any that only occur in clauses,
+        # are existential and can't depend on any universal variables.
+        free_indices = set(range(1, qdimacs.num_vars + 1))
+        free_indices.update(abs(l) for clause in qdimacs.clauses for l in clause)
+        for index in sorted(free_indices - variables.keys()):
+            variables[index] = Variable(index, QuantifierType.EXISTS)
+        self.variables_by_index: Dict[VariableIndex, Variable] = variables
+        # Literal mask (see Clause._literal_mask) of all universal literals,
+        # or None if a universal variable is too large to be masked.
+        self._universal_literal_mask: int | None = None
+        if all(u <= MAX_MASK_VARIABLE for u in self._universal_variables):
+            universal_mask = 0
+            for index in self._universal_variables:
+                universal_mask |= 1 << index
+            self._universal_literal_mask = universal_mask | (
+                universal_mask << _NEGATIVE_SHIFT
+            )
+
+        literals = [*variables, *(-index for index in variables)]
+        # Clauses containing each literal, keyed by signed literal index.
+        self.occurrences: Dict[LiteralIndex, Set[Clause]] = {
+            literal: set() for literal in literals
+        }
+        # The same clauses as in occurrences, bucketed by clause length.
+        self.occurrences_by_len: Dict[LiteralIndex, List[Set[Clause]]] = {
+            literal: [] for literal in literals
+        }
+        # len(self.occurrences[literal]), kept up to date incrementally.
+        self._occurrence_counts: Dict[LiteralIndex, int] = dict.fromkeys(literals, 0)
+
+        # Monotone counters: all variable/clause indices from these on are
+        # unused. Indices are never recycled. 0 is not a valid variable index.
+        self._next_variable_index = max(variables, default=0) + 1
+        self._next_clause_index = len(qdimacs.clauses)
+
+        # Every literal has a variable by now, so the original clauses are
+        # built directly. Duplicates (up to literal order) are dropped,
+        # keeping the first one.
+        self._prune_subsumed(
+            dict.fromkeys(
+                Clause(frozenset(clause), index, is_original=True)
+                for index, clause in enumerate(qdimacs.clauses)
+            )
+        )
 
     @property
     def variables(self) -> Iterable[Variable]:
@@ -167,42 +282,60 @@ class Formula:
         return self.variables_by_index.values()
 
     def next_fresh_variable_index(self) -> int:
-        """Return the next fresh variable index."""
-        while self._largest_used_variable_index in self.variables_by_index:
-            self._largest_used_variable_index += 1
-        return self._largest_used_variable_index
+        """Claim and return the next fresh variable index."""
+        index = self._next_variable_index
+        self._next_variable_index += 1
+        return index
 
     def create_fresh_variable(
         self,
         index: int | None = None,
         quantifier: QuantifierType = QuantifierType.EXISTS,
-        dependencies: Set[Variable] | None = None,
+        level: int = -1,
     ) -> Variable:
         """Create a new variable with the given quantifier."""
         index = index or self.next_fresh_variable_index()
         assert index not in self.variables_by_index
-        dependencies = dependencies or set()
-        self.variables_by_index[index] = Variable(index, quantifier, dependencies)
+        self.variables_by_index[index] = Variable(index, quantifier, level)
+        self._next_variable_index = max(self._next_variable_index, index + 1)
+        # Keep the tables for universal reduction in sync with the prefix.
+        self._variable_levels[index] = level
+        if quantifier is QuantifierType.FORALL:
+            self._universal_variables.add(index)
+            if index > MAX_MASK_VARIABLE:
+                self._universal_literal_mask = None
+            elif self._universal_literal_mask is not None:
+                self._universal_literal_mask |= 1 << index | 1 << (
+                    _NEGATIVE_SHIFT + index
+                )
+        for literal in (index, -index):
+            self.occurrences[literal] = set()
+            self.occurrences_by_len[literal] = []
+            self._occurrence_counts[literal] = 0
         return self.variables_by_index[index]
 
     def next_fresh_clause_index(self) -> int:
-        """Return the next fresh clause index."""
-        while self._largest_used_clause_index in self.clauses_by_index:
-            self._largest_used_clause_index += 1
-        return self._largest_used_clause_index
+        """Claim and return the next fresh clause index.
 
-    def get_literal_by_index(self, literal_index: int) -> Literal:
-        """Return the literal with the given QDIMACS index."""
-        variable_index = abs(literal_index)
-        is_positive = literal_index > 0
-        return self.variables_by_index[variable_index].get_literal(is_positive)
+        Indices are claimed on creation, as clauses are often created well
+        before they are added to the formula (if at all).
+        """
+        index = self._next_clause_index
+        self._next_clause_index += 1
+        return index
 
     def create_clause_from_qdimacs(
-        self, clause: Sequence[int], index: ClauseIndex
+        self, clause: Sequence[LiteralIndex], index: ClauseIndex
     ) -> Clause:
         """Create a clause from a list of QDIMACS literals."""
-        literals = (self.get_literal_by_index(lit) for lit in clause)
-        return Clause(frozenset(literals), index, is_original=True)
+        literals = frozenset(clause)
+        # Literals are their own QDIMACS indices. occurrences has an entry for
+        # both literals of every variable, so one set comparison checks them.
+        if not self.occurrences.keys() >= literals:
+            unknown = literals - self.occurrences.keys()
+            raise KeyError(f"Unknown literals {sorted(unknown)}")
+        self._next_clause_index = max(self._next_clause_index, index + 1)
+        return Clause(literals, index, is_original=True)
 
     def is_clause_subsumed(self, clause: Clause) -> bool:
         """Return whether the given clause is subsumed by another clause."""
@@ -213,85 +346,195 @@ class Formula:
         if not clause.literals:
             return False
         # Optimization: find literal with smallest number of occurrences
-        rarest_literal = min(clause.literals, key=lambda l: len(l.occurrences))
-        # Optimization: only check clauses that are shorter
-        candidate_clauses = (
-            c
-            for c in rarest_literal.occurrences
-            if len(c.literals) <= len(clause.literals)
+        rarest_literal = min(clause.literals, key=self._occurrence_counts.__getitem__)
+        if self._occurrence_counts[rarest_literal] == 0:
+            return False
+        # Optimization: only check strictly shorter clauses. A subset of the
+        # same length is the clause itself, which was checked above, and
+        # bucket 0 is always empty since the empty clause has no literals.
+        # Buckets are visited shortest first; short clauses are the most
+        # likely subsumers, so any() tends to stop early.
+        candidate_clauses = itertools.chain.from_iterable(
+            self.occurrences_by_len[rarest_literal][1 : len(clause.literals)]
         )
+        literal_mask = clause._literal_mask
+        if literal_mask is None:
+            # Rule out most candidates by signature before the set comparison.
+            signature = clause.signature()
+            return any(
+                other.signature() & ~signature == 0
+                and other.literals.issubset(clause.literals)
+                for other in candidate_clauses
+            )
+        # A subset of a masked clause only has small variables, so it is
+        # masked as well; unmasked candidates can't be subsets.
         return any(
-            other.literals.issubset(clause.literals) for other in candidate_clauses
+            other._literal_mask is not None
+            and other._literal_mask & literal_mask == other._literal_mask
+            for other in candidate_clauses
         )
 
     def add_clause(self, clause: Clause):
         """Add a clause to the formula."""
-        assert (
-            clause.index not in self.clauses
-        ), f"Clause {clause.index} already in formula. {clause}, {self.clauses[clause.index]}"
         if self.is_clause_subsumed(clause):
             return
+        assert (
+            clause.index not in self.clauses_by_index
+        ), f"Clause index {clause.index} already in use by {self.clauses_by_index[clause.index]}"
         self.clauses.add(clause)
         self.clauses_by_index[clause.index] = clause
+        length = len(clause.literals)
+        occurrence_counts = self._occurrence_counts
+        for literal in clause.literals:
+            self.occurrences[literal].add(clause)
+            occurrence_counts[literal] += 1
+            buckets = self.occurrences_by_len[literal]
+            if len(buckets) <= length:
+                buckets.extend(set() for _ in range(length + 1 - len(buckets)))
+            buckets[length].add(clause)
+        if not length:
+            self._has_empty_clause = True
+
+    def remove_clause(self, clause: Clause):
+        """Remove a clause from the formula."""
+        if clause not in self.clauses:
+            return
+        self.clauses.remove(clause)
+        self.clauses_by_index.pop(clause.index, None)
+        length = len(clause.literals)
+        occurrence_counts = self._occurrence_counts
         for literal in clause.literals:
-            literal.occurrences.add(clause)
+            self.occurrences[literal].remove(clause)
+            self.occurrences_by_len[literal][length].remove(clause)
+            occurrence_counts[literal] -= 1
+        if not length:
+            self._has_empty_clause = False
+
+    def _prune_subsumed(self, clauses: Iterable[Clause]):
+        """Add clauses shortest first, dropping tautologies and subsumed ones.
+
+        Each clause is only checked against the strictly shorter clauses added
+        before it, so subsumption is detected regardless of input order.
+        """
+        for clause in sorted(clauses, key=lambda c: len(c.literals)):
+            self.add_clause(clause)
 
     def contains_empty_clause(self) -> bool:
         """Return whether this formula contains the empty clause."""
-        return self.generate_empty_clause() in self.clauses
+        return self._has_empty_clause
 
     def resolve(self, clause1: Clause, clause2: Clause, variable: Variable) -> Clause:
         """Resolve two clauses with respect to a variable."""
         assert variable.index in self.variables_by_index
         assert clause1 is self.clauses_by_index[clause1.index]
         assert clause2 is self.clauses_by_index[clause2.index]
-        both_literals = itertools.chain(clause1.literals, clause2.literals)
-        literals = (l for l in both_literals if l.variable != variable.index)
-        return Clause.from_literals(
-            literals, self.next_fresh_clause_index(), is_original=False
-        )
+        literals = _resolvent_literals(clause1, clause2, variable)
+        return Clause(literals, self.next_fresh_clause_index(), is_original=False)
 
     def to_qdimacs(self) -> str:
         """Return a string representation of this formula in QDIMACS format."""
-        clauses_in_order = sorted(self.clauses, key=lambda c: c.index)
+        # Sorting the int keys avoids a key callback per comparison.
+        # Insertion order is not index order after subsumption pruning.
+        clauses_in_order = (
+            self.clauses_by_index[index] for index in sorted(self.clauses_by_index)
+        )
         clause_strings = (clause.to_qdimacs() for clause in clauses_in_order)
         header = f"p cnf {len(self.variables_by_index)} {len(self.clauses)}"
         all_lines = itertools.chain([header], clause_strings)
         return "\n".join(all_lines)
 
-    @functools.lru_cache()
     def generate_empty_clause(self) -> Clause:
-        """Generate an empty clause."""
-        return Clause.from_literals(
-            (), self.next_fresh_clause_index(), is_original=False
-        )
+        """Return this formula's empty clause, creating it on first use."""
+        if self._empty_clause is None:
+            self._empty_clause = Clause.from_literals(
+                (), self.next_fresh_clause_index(), is_original=False
+            )
+        return self._empty_clause
 
     def eliminate_variable(self, variable: Variable) -> None:
-        """Eliminate a variable from the formula."""
+        """Eliminate a variable from the formula.
+
+        Stops as soon as the empty clause is derived; the formula is false
+        then, and the remaining resolvents don't matter.
+        """
         assert variable.index in self.variables_by_index
 
-        # Collect all resolvents first
-        resolvents = []
-        for positive_clause in variable.positive.occurrences:
-            for negative_clause in variable.negative.occurrences:
-                resolvent = self.resolve(positive_clause, negative_clause, variable)
-                # apply universal reduction
-                resolvent = self.universal_reduction(resolvent)
-                resolvents.append(resolvent)
-
-        # Mark all clauses containing the variable as inactive
-        for clause in variable.positive.occurrences | variable.negative.occurrences:
-            if clause.index in self.clauses_by_index:
-                del self.clauses_by_index[clause.index]
-            if clause in self.clauses:
-                self.clauses.remove(clause)
-
-        # Remove the variable from the set of variables
+        positive_clauses = list(self.occurrences[variable.positive])
+        negative_clauses = list(self.occurrences[variable.negative])
+
+        # Remove the variable and all clauses containing it first, so that
+        # each resolvent can be added as soon as it is derived.
+        remove_clause = self.remove_clause
+        for clause in itertools.chain(positive_clauses, negative_clauses):
+            remove_clause(clause)
+        del self.variables_by_index[variable.index]
+        for literal in (variable.positive, variable.negative):
+            del self.occurrences[literal]
+            del self.occurrences_by_len[literal]
+            del self._occurrence_counts[literal]
+
+        # Bound once; the loops below run once per pair of parent clauses.
+        add_clause = self.add_clause
+        universal_reduction = self.universal_reduction
+        next_fresh_clause_index = self.next_fresh_clause_index
+        pivot_mask = 1 << variable.index | 1 << (_NEGATIVE_SHIFT + variable.index)
+        for positive_clause in positive_clauses:
+            positive_mask = positive_clause._literal_mask
+            for negative_clause in negative_clauses:
+                negative_mask = negative_clause._literal_mask
+                if positive_mask is not None and negative_mask is not None:
+                    # Detect tautological resolvents before building them.
+                    union = (positive_mask | negative_mask) & ~pivot_mask
+                    if union & _POSITIVE_BITS & (union >> _NEGATIVE_SHIFT):
+                        continue
+                # Not resolve(), which requires the parents to be in the formula.
+                literals = _resolvent_literals(
+                    positive_clause, negative_clause, variable
+                )
+                resolvent = Clause(
+                    literals, next_fresh_clause_index(), is_original=False
+                )
+                # Tautologies are dropped by add_clause anyway; skip them before
+                # universal reduction, which could strip the complementary pair.
+                if resolvent.is_tautology():
+                    continue
+                add_clause(universal_reduction(resolvent))
+                if self._has_empty_clause:
+                    return
+
+    def reduce_universal_variable(self, variable: Variable) -> None:
+        """Remove a universal variable from all clauses.
+
+        Only valid once all existential variables quantified inside the
+        variable have been eliminated; universal reduction then removes the
+        variable's literals from every clause.
+        """
+        assert variable.quantifier is QuantifierType.FORALL
+
+        clauses = list(self.occurrences[variable.positive])
+        clauses.extend(self.occurrences[variable.negative])
+        for clause in clauses:
+            self.remove_clause(clause)
         del self.variables_by_index[variable.index]
+        for literal in (variable.positive, variable.negative):
+            del self.occurrences[literal]
+            del self.occurrences_by_len[literal]
+            del self._occurrence_counts[literal]
+
+        pivot_literals = {variable.positive, variable.negative}
+        for clause in clauses:
+            literals = clause.literals - pivot_literals
+            if not literals:
+                self.add_clause(self.generate_empty_clause())
+                continue
+            self.add_clause(
+                Clause(literals, self.next_fresh_clause_index(), is_original=False)
+            )
 
-        # Now add all the resolvents
-        for resolvent in resolvents:
-            self.add_clause(resolvent)
+    def elimination_cost(self, variable: Variable) -> int:
+        """Return the number of resolvents eliminating the variable would create."""
+        counts = self._occurrence_counts
+        return counts[variable.positive] * counts[variable.negative]
 
     def is_propositional_formula(self) -> bool:
         """Return whether this formula is quantifier-free."""
@@ -306,81 +549,40 @@ class Formula:
         if the universal variable is quantified to the right of all existential
         variable in the same clause.
         """
-        if not self.quantifiers:
-            # No quantifiers, return clause as-is
+        # Fast path: a single AND rules out most clauses without a universal.
+        universal_literal_mask = self._universal_literal_mask
+        literal_mask = clause._literal_mask
+        if literal_mask is not None and universal_literal_mask is not None:
+            if literal_mask & universal_literal_mask == 0:
+                return clause
+        universal_variables = self._universal_variables
+        universal_literals = [
+            l for l in clause.literals if abs(l) in universal_variables
+        ]
+        if not universal_literals:
             return clause
 
-        # Build quantifier level mapping and type mapping
-        var_to_level = {}
-        var_to_quantifier = {}
-        for level, quantifier_block in enumerate(self.quantifiers):
-            for var_index in quantifier_block.bound_variables:
-                var_to_level[var_index] = level
-                var_to_quantifier[var_index] = quantifier_block.quantifier_type
-
-        # Separate universal and existential literals
-        universal_literals = []
-        existential_literals = []
-
-        for literal in clause.literals:
-            var_index = literal.variable
-            if var_index in var_to_quantifier:
-                if var_to_quantifier[var_index] == QuantifierType.FORALL:
-                    universal_literals.append(literal)
-                else:
-                    existential_literals.append(literal)
-            else:
-                # Treat unquantified variables as existential
-                existential_literals.append(literal)
-
-        # Apply universal reduction rule:
-        # Remove universal literals that are at a higher level (right) than ANY existential literal
-        reduced_literals = list(existential_literals)
-
-        for universal_lit in universal_literals:
-            universal_level = var_to_level.get(universal_lit.variable, -1)
-
-            # Check if this universal literal can be reduced
-            # It can be reduced if it's at a higher level than ANY existential literal
-            can_reduce = False
-            for existential_lit in existential_literals:
-                existential_level = var_to_level.get(
-                    existential_lit.variable, float("inf")
-                )
-                # If universal is at a higher level than this existential, it can be reduced
-                if universal_level > existential_level:
-                    can_reduce = True
-                    break
-
-            if not can_reduce:
-                # Keep the universal literal
-                reduced_literals.append(universal_lit)
-
-        # Create new clause with reduced literals
-        if len(reduced_literals) == len(clause.literals):
+        # Level of the innermost existential literal; unquantified variables
+        # are existentials of the outermost level.
+        levels = self._variable_levels
+        innermost_existential_level = max(
+            (
+                levels.get(abs(l), -1)
+                for l in clause.literals
+                if abs(l) not in universal_variables
+            ),
+            default=-1,
+        )
+        reduced_literals = [
+            l
+            for l in universal_literals
+            if levels[abs(l)] > innermost_existential_level
+        ]
+        if not reduced_literals:
             # No reduction possible, return original clause
             return clause
 
-        # Create a new clause with the reduced literals
-        # We need to make sure the literals reference the correct variables
-        corrected_literals = []
-        for lit in reduced_literals:
-            if lit.variable in self.variables_by_index:
-                # Use the existing literal from the variable
-                var = self.variables_by_index[lit.variable]
-                corrected_literals.append(var.get_literal(lit.is_positive))
-            else:
-                # Variable doesn't exist anymore, skip this literal
-                continue
-
-        if not corrected_literals:
-            # If no literals remain, return an empty clause
-            # return Clause.from_literals(
-            #     [], self.next_fresh_clause_index(), is_original=False
-            # )
+        literals = clause.literals.difference(reduced_literals)
+        if not literals:
             return self.generate_empty_clause()
-
-        new_clause = Clause.from_literals(
-            corrected_literals, self.next_fresh_clause_index(), is_original=False
-        )
-        return new_clause
+        return Clause(literals, self.next_fresh_clause_index(), is_original=False)
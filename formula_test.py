@@ -32,6 +32,8 @@ def test_literal_equality():
     assert -lit1 == lit3
     assert -lit3 == lit1
     assert lit1 == -(-lit1)
+    # Negation is plain integer negation and creates no Literal objects.
+    assert type(-lit1) is int
 
 
 def test_tautology():
@@ -100,3 +102,143 @@ def test_eliminate_variable():
 
     assert len(phi.variables_by_index) == 2
     assert len(phi.clauses) == 1
+
+
+def test_is_clause_subsumed():
+    """Test that a clause is subsumed by a clause with a subset of its literals."""
+    phi = formula.Formula(parse.QDimacs(3, [[1, 2], [1, 3]], []))
+    superset = phi.create_clause_from_qdimacs([1, 2, 3], 2)
+    other = phi.create_clause_from_qdimacs([2, -3], 3)
+
+    assert phi.is_clause_subsumed(superset)
+    assert not phi.is_clause_subsumed(other)
+
+
+def test_formula_creation_removes_subsumed_clauses():
+    """Test that clauses subsumed by later, shorter clauses are removed."""
+    phi = formula.Formula(parse.QDimacs(2, [[1, 2], [1], [2]], []))
+
+    assert len(phi.clauses) == 2
+    assert 0 not in phi.clauses_by_index
+
+
+def test_is_clause_subsumed_large_variables():
+    """Test subsumption and tautologies for variables beyond the bitmask range."""
+    large = formula.MAX_MASK_VARIABLE + 1
+    phi = formula.Formula(parse.QDimacs(large, [[1, large], [2, large]], []))
+    superset = phi.create_clause_from_qdimacs([1, 2, large], 2)
+    tautology = phi.create_clause_from_qdimacs([large, -large], 3)
+
+    assert phi.is_clause_subsumed(superset)
+    assert tautology.is_tautology()
+
+
+def test_fresh_clause_indices_are_unique():
+    """Test that clauses created before being added get distinct indices."""
+    phi = formula.Formula(parse.QDimacs(2, [[1, 2], [-1, 2]], []))
+    first = phi.next_fresh_clause_index()
+    second = phi.next_fresh_clause_index()
+
+    assert first != second
+    assert first not in phi.clauses_by_index
+    assert second not in phi.clauses_by_index
+
+
+def test_eliminate_variable_skips_tautologies():
+    """Test that tautological resolvents are not added to the formula."""
+    qdimacs = parse.QDimacs(3, [[1, 2, 3], [-1, -2, 3]], [])
+    phi = formula.Formula(qdimacs)
+    phi.eliminate_variable(phi.variables_by_index[1])
+
+    assert len(phi.clauses) == 0
+
+
+def test_to_qdimacs_orders_clauses_by_index():
+    """Test that to_qdimacs prints the clauses in index order."""
+    phi = formula.Formula(parse.QDimacs(3, [[1, 2, 3], [-1, -3]], []))
+
+    lines = phi.to_qdimacs().splitlines()
+    assert lines[0] == "p cnf 3 2"
+    assert lines[1] == "c Clause 0, original"
+    assert lines[3] == "c Clause 1, original"
+    assert lines[4] == "-3 -1 0"
+
+
+def test_universal_reduction():
+    """Test that universals are reduced only if inner to all existentials."""
+    quantifiers = [
+        parse.QuantifierBlock([1], parse.QuantifierType.EXISTS),
+        parse.QuantifierBlock([2], parse.QuantifierType.FORALL),
+        parse.QuantifierBlock([3], parse.QuantifierType.EXISTS),
+    ]
+    phi = formula.Formula(parse.QDimacs(3, [], quantifiers))
+    reducible = phi.create_clause_from_qdimacs([1, 2], 0)
+    irreducible = phi.create_clause_from_qdimacs([1, 2, 3], 1)
+    universal_only = phi.create_clause_from_qdimacs([-2], 2)
+
+    assert phi.universal_reduction(reducible).literals == {1}
+    assert phi.universal_reduction(irreducible) is irreducible
+    assert not phi.universal_reduction(universal_only).literals
+
+
+def test_universal_reduction_fresh_universal():
+    """Test that fresh universals are reduced like those from the prefix."""
+    quantifiers = [
+        parse.QuantifierBlock([1], parse.QuantifierType.EXISTS),
+        parse.QuantifierBlock([2], parse.QuantifierType.FORALL),
+    ]
+    phi = formula.Formula(parse.QDimacs(2, [], quantifiers))
+    phi.create_fresh_variable(3, parse.QuantifierType.FORALL, level=2)
+    clause = phi.create_clause_from_qdimacs([1, 3], 0)
+    assert phi.universal_reduction(clause).literals == {1}
+
+    # Universals beyond the bitmask range disable the fast path.
+    large = formula.MAX_MASK_VARIABLE + 1
+    phi.create_fresh_variable(large, parse.QuantifierType.FORALL, level=2)
+    clause = phi.create_clause_from_qdimacs([1, -large], 1)
+    assert phi.universal_reduction(clause).literals == {1}
+
+
+def test_reduce_universal_variable():
+    """Test that reducing a universal variable removes it from all clauses."""
+    quantifiers = [
+        parse.QuantifierBlock([1], parse.QuantifierType.EXISTS),
+        parse.QuantifierBlock([2], parse.QuantifierType.FORALL),
+    ]
+    phi = formula.Formula(parse.QDimacs(2, [[1, 2], [-2]], quantifiers))
+    phi.reduce_universal_variable(phi.variables_by_index[2])
+
+    assert 2 not in phi.variables_by_index
+    assert phi.contains_empty_clause()
+    assert formula.Clause.from_literals([1], 0) in phi.clauses
+
+
+def test_variable_dependencies():
+    """Test that existentials depend on exactly the outer universals."""
+    quantifiers = [
+        parse.QuantifierBlock([1], parse.QuantifierType.EXISTS),
+        parse.QuantifierBlock([2], parse.QuantifierType.FORALL),
+        parse.QuantifierBlock([3], parse.QuantifierType.EXISTS),
+        parse.QuantifierBlock([4], parse.QuantifierType.FORALL),
+    ]
+    phi = formula.Formula(parse.QDimacs(4, [], quantifiers))
+
+    variables = phi.variables_by_index
+    assert not variables[1].depends_on(variables[2])
+    assert variables[3].depends_on(variables[2])
+    assert not variables[3].depends_on(variables[4])
+    assert not variables[3].depends_on(variables[1])
+
+
+def test_contains_empty_clause():
+    """Test that deriving the empty clause is detected."""
+    phi = formula.Formula(parse.QDimacs(2, [[1, 2], [-1]], []))
+    assert not phi.contains_empty_clause()
+    phi.eliminate_variable(phi.variables_by_index[1])
+    assert not phi.contains_empty_clause()
+    phi.eliminate_variable(phi.variables_by_index[2])
+    assert not phi.contains_empty_clause()
+
+    phi = formula.Formula(parse.QDimacs(1, [[1], [-1]], []))
+    phi.eliminate_variable(phi.variables_by_index[1])
+    assert phi.contains_empty_clause()
@@ -1,10 +1,14 @@
 """QBF solver library."""
 
+import heapq
+import itertools
+from typing import Iterable, Union
+
 import parse
 import formula
 
 
-def solve_file(file_content: str) -> str:
+def solve_file(file_content: Union[str, bytes]) -> str:
     """Solve a QBF given in QDIMACS format."""
     puzzle = parse.from_qdimacs(file_content)
     return solve(puzzle)
@@ -16,14 +20,56 @@ def solve(puzzle: parse.QDimacs) -> str:
 
 
 def solve_by_variable_elimination(puzzle: parse.QDimacs) -> str:
-    """Solve a QBF puzzle by eliminating variables."""
+    """Solve a QBF puzzle by eliminating variables.
+
+    Quantifier blocks are processed from the innermost to the outermost, so
+    that every variable is eliminated while it is innermost: existential
+    variables by resolution, universal variables by universal reduction.
+    Unquantified variables are existentials of the outermost block.
+    """
     # Create the formula
     phi = formula.Formula(puzzle)
 
+    blocks = puzzle.prefix()
+    quantified = set(itertools.chain.from_iterable(v for _, v in blocks))
+    unquantified = [v.index for v in phi.variables if v.index not in quantified]
+    blocks.insert(0, (False, unquantified))
+
     # Eliminate the variables
-    for variable in list(phi.variables):
-        phi.eliminate_variable(variable)
-        if phi.contains_empty_clause():
+    for is_forall, variable_indices in reversed(blocks):
+        if is_forall:
+            for index in variable_indices:
+                phi.reduce_universal_variable(phi.variables_by_index[index])
+            if phi.contains_empty_clause():
+                return "UNSAT"
+        elif not _eliminate_existentials(phi, variable_indices):
             return "UNSAT"
 
     return "SAT"
+
+
+def _eliminate_existentials(
+    phi: formula.Formula, variable_indices: Iterable[int]
+) -> bool:
+    """Eliminate existential variables of one block, cheapest first.
+
+    Returns False as soon as the empty clause is derived. Elimination costs
+    change as clauses come and go, so costs in the heap may be stale; they
+    are re-checked when popped (lazy deletion).
+    """
+    heap = [
+        (phi.elimination_cost(phi.variables_by_index[index]), index)
+        for index in variable_indices
+    ]
+    heapq.heapify(heap)
+    while heap:
+        cost, index = heapq.heappop(heap)
+        variable = phi.variables_by_index[index]
+        current_cost = phi.elimination_cost(variable)
+        if current_cost > cost:
+            heapq.heappush(heap, (current_cost, index))
+            continue
+        phi.eliminate_variable(variable)
+        if phi.contains_empty_clause():
+            return False
+    return True
@@ -31,13 +31,13 @@ def test_solve_with_quantifiers():
     puzzle = parse.QDimacs(2, [[1, 2], [-1, -2]], quantifiers)
     result = lib.solve(puzzle)
     assert isinstance(result, str)
-    assert result == "UNSAT"  # Based on our placeholder implementation
+    # x=true falsifies (¬x ∨ ¬y) for y=true, x=false falsifies (x ∨ y) for y=false
+    assert result == "UNSAT"
 
 
 def test_solve_satisfiable_formula():
-    """Test solving a satisfiable QBF formula (currently returns UNSAT due to placeholder)."""
-    # This is a tautology: ∃x.(x ∨ ¬x) - should be satisfiable
-    # But our placeholder implementation always returns "UNSAT"
+    """Test solving a satisfiable QBF formula."""
+    # ∃x.x is satisfied by x=true
     file_content = """p cnf 1 2
 e 1 0
 1 0
@@ -51,7 +51,6 @@ e 1 0
 def test_solve_another_satisfiable_formula():
     """Test solving another satisfiable QBF: ∃x∀y.(x ∨ y)."""
     # This formula is satisfiable: if we set x=true, then (x ∨ y) is true for any y
-    # But our placeholder implementation always returns "UNSAT"
     quantifiers = [
         parse.QuantifierBlock([1], parse.QuantifierType.EXISTS),
         parse.QuantifierBlock([2], parse.QuantifierType.FORALL),
@@ -87,3 +86,18 @@ def test_solve_classical_unsatisfiable():
     result = lib.solve_file(file_content)
     assert isinstance(result, str)
     assert result == "UNSAT"
+
+
+def test_solve_respects_quantifier_order():
+    """Test that the solver distinguishes ∀x∃y from ∃y∀x on the same matrix."""
+    clauses = [[1, 2], [-1, -2]]
+    forall_exists = [
+        parse.QuantifierBlock([1], parse.QuantifierType.FORALL),
+        parse.QuantifierBlock([2], parse.QuantifierType.EXISTS),
+    ]
+    exists_forall = [
+        parse.QuantifierBlock([2], parse.QuantifierType.EXISTS),
+        parse.QuantifierBlock([1], parse.QuantifierType.FORALL),
+    ]
+    assert lib.solve(parse.QDimacs(2, clauses, forall_exists)) == "SAT"
+    assert lib.solve(parse.QDimacs(2, clauses, exists_forall)) == "UNSAT"
@@ -18,7 +18,8 @@ def main():
     args = parser.parse_args()
 
     try:
-        with open(args.file) as file:
+        # Read as bytes; the parser doesn't need the matrix decoded.
+        with open(args.file, "rb") as file:
             file_content = file.read()
     except FileNotFoundError:
         print(f"File {args.file} not found.", file=sys.stderr)
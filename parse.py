@@ -1,8 +1,18 @@
 """Parse utilities for QDIMACS files."""
 
-from typing import List, Sequence
+import re
+from typing import List, Sequence, Tuple, Union
 from enum import Enum
 
+# Comment lines, to be removed from the matrix before tokenizing it.
+_COMMENT_LINE = re.compile(r"^c.*$", re.MULTILINE)
+_COMMENT_LINE_BYTES = re.compile(rb"^c.*$", re.MULTILINE)
+# Quantifier lines, only searched for to explain a bad token in the matrix.
+_QUANTIFIER_LINE = re.compile(r"^\s*[ae]\b", re.MULTILINE)
+_QUANTIFIER_LINE_BYTES = re.compile(rb"^\s*[ae]\b", re.MULTILINE)
+# A well-formed header line, stripped.
+_HEADER = re.compile(r"p\s+cnf\s+(\d+)\s+(\d+)")
+
 
 class QuantifierType(Enum):
     """Enum for quantifier types in QDIMACS files."""
@@ -31,17 +41,26 @@ class QDimacsParseError(QDimacsError):
 class QuantifierBlock:
     """Represents a quantifier block in a QDIMACS file."""
 
-    def __init__(self, bound_variables: List[int], quantifier_type: QuantifierType):
+    __slots__ = ("bound_variables", "quantifier_type")
+
+    def __init__(
+        self,
+        bound_variables: List[int],
+        quantifier_type: Union[QuantifierType, str],
+    ):
+        # Also accept the enum values, "forall" and "exists".
+        if isinstance(quantifier_type, str):
+            quantifier_type = QuantifierType(quantifier_type)
         self.bound_variables = bound_variables
         self.quantifier_type = quantifier_type
 
     def is_forall(self) -> bool:
         """Return whether this is a forall quantifier block."""
-        return self.quantifier_type == QuantifierType.FORALL
+        return self.quantifier_type is QuantifierType.FORALL
 
     def is_exists(self) -> bool:
         """Return whether this is an exists quantifier block."""
-        return self.quantifier_type == QuantifierType.EXISTS
+        return self.quantifier_type is QuantifierType.EXISTS
 
     def __eq__(self, other) -> bool:
         """Return whether this QuantifierBlock is equal to another."""
@@ -49,7 +68,7 @@ class QuantifierBlock:
             return False
         return (
             self.bound_variables == other.bound_variables
-            and self.quantifier_type == other.quantifier_type
+            and self.quantifier_type is other.quantifier_type
         )
 
     def __repr__(self) -> str:
@@ -60,6 +79,8 @@ class QuantifierBlock:
 class QDimacs:
     """Represents a QDIMACS file."""
 
+    __slots__ = ("num_vars", "clauses", "quantifiers")
+
     def __init__(
         self,
         num_vars: int,
@@ -77,15 +98,22 @@ class QDimacs:
         self.clauses: List[List[int]] = list(clauses)
         self.quantifiers: List[QuantifierBlock] = list(quantifiers)
 
+    def prefix(self) -> List[Tuple[bool, List[int]]]:
+        """Return the quantifier blocks as (is_forall, bound variables) pairs."""
+        return [
+            (block.quantifier_type is QuantifierType.FORALL, block.bound_variables)
+            for block in self.quantifiers
+        ]
+
     def copy(self) -> "QDimacs":
         """Return a copy of this QDimacs instance."""
         return QDimacs(self.num_vars, self.clauses, self.quantifiers)
 
     def __str__(self) -> str:
         """Return a string representation of the QDIMACS file."""
-        return f"p cnf {self.num_vars} {len(self.clauses)}\n" + "\n".join(
-            " ".join(str(lit) for lit in clause) + " 0" for clause in self.clauses
-        )
+        lines = [f"p cnf {self.num_vars} {len(self.clauses)}"]
+        lines.extend([" ".join(map(str, clause)) + " 0" for clause in self.clauses])
+        return "\n".join(lines)
 
     def __eq__(self, other) -> bool:
         """Return whether this QDimacs is equal to another."""
@@ -102,18 +130,15 @@ class QDimacs:
         return f"QDimacs({self.num_vars}, {self.clauses}, {self.quantifiers})"
 
 
-def from_qdimacs(file_content: str) -> QDimacs:
-    """Parse a QDIMACS file from string."""
-    lines = file_content.splitlines()
-    # Remove comments and empty lines
-    lines = [
-        line.strip() for line in lines if line.strip() and not line.startswith("c")
-    ]
+def _parse_header(line: str) -> Tuple[int, int]:
+    """Return the number of variables and clauses of a header line."""
+    # One regex match covers the common case; the checks below only run to
+    # report what is wrong with a malformed header.
+    match = _HEADER.fullmatch(line)
+    if match:
+        return int(match.group(1)), int(match.group(2))
 
-    if not lines:
-        raise QDimacsParseError("Empty file")
-
-    header = lines[0].split()
+    header = line.split()
     if header[0] != "p":
         raise QDimacsParseError("Invalid header")
 
@@ -124,68 +149,131 @@ def from_qdimacs(file_content: str) -> QDimacs:
         raise QDimacsParseError("Invalid header")
 
     try:
-        num_vars = int(header[2])
-        num_clauses = int(header[3])
+        return int(header[2]), int(header[3])
     except ValueError:
         raise QDimacsParseError("Invalid header")
 
+
+def from_qdimacs(file_content: Union[str, bytes]) -> QDimacs:
+    """Parse a QDIMACS file from string or bytes.
+
+    QDIMACS is ASCII, so reading a file as bytes saves decoding the matrix;
+    only the header and quantifier lines are decoded.
+    """
+    is_bytes = isinstance(file_content, bytes)
+    newline = b"\n" if is_bytes else "\n"
+    # Like str.splitlines, accept "\r" line endings; lines are only ever split
+    # at "\n" below. The extra empty lines of "\r\n" endings are skipped.
+    carriage_return = b"\r" if is_bytes else "\r"
+    if carriage_return in file_content:
+        file_content = file_content.replace(carriage_return, newline)
+
+    # Read the header and the quantifier prefix line by line, up to the first
+    # line of the matrix. Comments and empty lines are skipped.
+    lines = []
+    position = 0
+    while position < len(file_content):
+        line_end = file_content.find(newline, position)
+        if line_end == -1:
+            line_end = len(file_content)
+        line = file_content[position:line_end]
+        if is_bytes:
+            line = line.decode(errors="replace")
+        stripped = line.strip()
+        if stripped and line[:1] != "c":
+            if lines and stripped[:1] not in ("a", "e"):
+                break
+            lines.append(stripped)
+        position = line_end + 1
+    matrix = file_content[position:]
+
+    if not lines:
+        raise QDimacsParseError("Empty file")
+
+    num_vars, num_clauses = _parse_header(lines[0])
     if num_vars <= 0:
         raise QDimacsParseError("Invalid number of variables")
 
     if num_clauses < 0:
         raise QDimacsParseError("Invalid number of clauses")
 
-    clauses = []
+    # The quantifier prefix precedes the matrix, one block per line.
     quantifiers = []
     for line in lines[1:]:
-        if line.startswith("a"):
+        # Every prefix line starts with "a" or "e", see above.
+        if line[:1] == "a":
             quantifier_type = QuantifierType.FORALL
-            line = line[1:]
-        elif line.startswith("e"):
-            quantifier_type = QuantifierType.EXISTS
-            line = line[1:]
         else:
-            quantifier_type = None
-
-        if quantifier_type is not None:
-            try:
-                variables = line.split()
-                # Quantifier blocks must end with 0
-                if not variables or variables[-1] != "0":
-                    raise QDimacsParseError("Quantifier blocks must end with 0")
-                variables = variables[:-1]
-                if not variables:
-                    raise QDimacsParseError("Empty quantifier block")
-                quantifiers.append(
-                    QuantifierBlock(
-                        [int(literal) for literal in variables], quantifier_type
-                    )
-                )
-            except ValueError:
-                raise QDimacsParseError("Invalid quantifier")
-            continue
-
-        literals = line.split()
-        if literals[-1] != "0":
-            raise QDimacsParseError("Clauses must end with 0")
-
+            quantifier_type = QuantifierType.EXISTS
+        variables = line[1:].split()
+        # Quantifier blocks must end with 0
+        if not variables or variables[-1] != "0":
+            raise QDimacsParseError("Quantifier blocks must end with 0")
+        variables.pop()
+        if not variables:
+            raise QDimacsParseError("Empty quantifier block")
         try:
-            clause = [int(literal) for literal in literals[:-1]]
+            bound_variables = list(map(int, variables))
         except ValueError:
-            raise QDimacsParseError("Invalid literal")
-
-        if not clause:
-            raise QDimacsParseError("Empty clause")
-
-        if any(literal == 0 for literal in clause):
-            raise QDimacsParseError("Clauses must not contain 0")
-
-        if any(abs(literal) > num_vars for literal in clause):
+            raise QDimacsParseError("Invalid quantifier")
+        # A 0 inside the block would terminate it early; `in` scans in C.
+        if 0 in bound_variables:
+            raise QDimacsParseError("Quantifier blocks must not contain 0")
+        if min(bound_variables) < 1 or max(bound_variables) > num_vars:
             raise QDimacsParseError("Variable out of range")
+        quantifiers.append(QuantifierBlock(bound_variables, quantifier_type))
+
+    # Tokenize the whole matrix at once and cut it into clauses at the
+    # 0 terminators, instead of splitting and converting line by line.
+    # Comment lines inside the matrix are blanked out in one pass first.
+    if is_bytes:
+        if matrix.startswith(b"c") or b"\nc" in matrix:
+            matrix = _COMMENT_LINE_BYTES.sub(b"", matrix)
+    elif matrix.startswith("c") or "\nc" in matrix:
+        matrix = _COMMENT_LINE.sub("", matrix)
+    # int() accepts bytes tokens as well.
+    tokens = matrix.split()
+    if tokens and tokens[-1] not in ("0", b"0"):
+        raise QDimacsParseError("Clauses must end with 0")
+
+    # Each distinct token is converted once; repeated literals then share one
+    # int object, which saves an allocation per occurrence.
+    try:
+        values = {token: int(token) for token in set(tokens)}
+    except ValueError:
+        # The prefix ends at the first clause, so a quantifier block after it
+        # is rejected; report that rather than its "a" or "e" token.
+        quantifier_line = _QUANTIFIER_LINE_BYTES if is_bytes else _QUANTIFIER_LINE
+        if quantifier_line.search(matrix):
+            raise QDimacsParseError("Quantifier block after clauses")
+        raise QDimacsParseError("Invalid literal")
+    literals = list(map(values.__getitem__, tokens))
+
+    # Validate all distinct literals at once; min and max run in C.
+    if values and (min(values.values()) < -num_vars or max(values.values()) > num_vars):
+        raise QDimacsParseError("Variable out of range")
+
+    # Cut the literals into clauses at the 0 terminators. Validation happens
+    # in the same pass; the range check was already done above.
+    clauses = []
+    # Clauses seen so far, for a constant-time duplicate check. Clauses are
+    # sets of literals, so literal order and repetitions don't matter.
+    seen = set()
+    find_terminator = literals.index
+    append_clause = clauses.append
+    start = 0
+    num_literals = len(literals)
+    while start < num_literals:
+        end = find_terminator(0, start)
+        if end == start:
+            raise QDimacsParseError("Empty clause")
+        clause = literals[start:end]
+        start = end + 1
 
-        if clause in clauses:
+        key = frozenset(clause)
+        if key in seen:
             raise QDimacsParseError("Duplicate clause")
-
-        clauses.append(clause)
+        seen.add(key)
+        append_clause(clause)
 
     return QDimacs(num_vars, clauses, quantifiers)
@@ -1,262 +1,60 @@
 """Tests for the parse module."""
 
-import pytest
-
-import parse
-
-
-def test_parse_empty():
-    """Test that parse.from_qdimacs raises the correct exceptions."""
-    with pytest.raises(parse.QDimacsParseError):
-        parse.from_qdimacs("")
-    with pytest.raises(parse.QDimacsParseError):
-        parse.from_qdimacs("c")
-
-
-def test_parse_header_raises():
-    """Test that parse.from_qdimacs raises the correct exceptions."""
-    with pytest.raises(parse.QDimacsParseError):
-        parse.from_qdimacs("p")
-    with pytest.raises(parse.QDimacsParseError):
-        parse.from_qdimacs("p cnf")
-    with pytest.raises(parse.QDimacsParseError):
-        parse.from_qdimacs("p cnf 0")
-    with pytest.raises(parse.QDimacsParseError):
-        parse.from_qdimacs("p cnf 1")
-    with pytest.raises(parse.QDimacsParseError):
-        parse.from_qdimacs("q cnf 1 1")  # Invalid header prefix
-    with pytest.raises(parse.QDimacsParseError):
-        parse.from_qdimacs("p sat 1 1")  # Invalid format
-    with pytest.raises(parse.QDimacsParseError):
-        parse.from_qdimacs("p cnf a 1")  # Invalid number of variables
-    with pytest.raises(parse.QDimacsParseError):
-        parse.from_qdimacs("p cnf 1 a")  # Invalid number of clauses
-    with pytest.raises(parse.QDimacsParseError):
-        parse.from_qdimacs("p cnf 0 1")  # Invalid number of variables
-    with pytest.raises(parse.QDimacsParseError):
-        parse.from_qdimacs("p cnf 1 -1")  # Invalid number of clauses
-
-
-def test_parse_header():
-    """Test parsing valid headers."""
-    assert parse.from_qdimacs("p cnf 1 0") == parse.QDimacs(1, [], [])
-
-
-def test_parse_comments():
-    """Test that parse.from_qdimacs ignores comments."""
-    assert parse.from_qdimacs("c\np cnf 1 0") == parse.QDimacs(1, [], [])
-    assert parse.from_qdimacs("c\np cnf 1 0\nc") == parse.QDimacs(1, [], [])
-
-
-def test_parse_clauses():
-    """Test parsing valid clauses."""
-    assert parse.from_qdimacs("p cnf 1 1\n1 0") == parse.QDimacs(1, [[1]], [])
-    assert parse.from_qdimacs("p cnf 1 2\n1 0\n-1 0") == parse.QDimacs(
-        1, [[1], [-1]], []
-    )
-    assert parse.from_qdimacs("p cnf 2 2\n1 2 0\n-1 0") == parse.QDimacs(
-        2, [[1, 2], [-1]], []
-    )
-
-
-def test_parse_invalid_clauses():
-    """Test parsing invalid clauses."""
-    # Clause without ending 0
-    with pytest.raises(parse.QDimacsParseError):
-        parse.from_qdimacs("p cnf 1 1\n1")
-
-    # Clause with invalid literal
-    with pytest.raises(parse.QDimacsParseError):
-        parse.from_qdimacs("p cnf 1 1\nabc 0")
-
-    # Empty clause
-    with pytest.raises(parse.QDimacsParseError):
-        parse.from_qdimacs("p cnf 1 1\n0")
-
-    # Clause with 0 in the middle
-    with pytest.raises(parse.QDimacsParseError):
-        parse.from_qdimacs("p cnf 1 1\n1 0 2 0")
-
-    # Clause with variable out of range
-    with pytest.raises(parse.QDimacsParseError):
-        parse.from_qdimacs("p cnf 1 1\n2 0")
-
-    # Duplicate clause
-    with pytest.raises(parse.QDimacsParseError):
-        parse.from_qdimacs("p cnf 1 2\n1 0\n1 0")
-
-    # Test that empty clauses are rejected
-    with pytest.raises(parse.QDimacsParseError):
-        parse.from_qdimacs("p cnf 1 1\n 0")
-
-    # Test that clauses with 0 in them are rejected
-    with pytest.raises(parse.QDimacsParseError):
-        parse.from_qdimacs("p cnf 1 1\n0 1 0")
-
-
-def test_parse_qdimacs():
-    """Test that parse.from_qdimacs correctly parses a QDIMACS file."""
-    # Test that parse.from_qdimacs calls parse.from_qdimacs
-    assert parse.from_qdimacs("p cnf 1 1\n1 0") == parse.QDimacs(1, [[1]], [])
-
-
-def test_parse_forall_quantifier():
-    """Test parsing forall quantifier."""
-    result = parse.from_qdimacs("p cnf 2 1\na 1 2 0\n1 2 0")
-    expected = parse.QDimacs(
-        2, [[1, 2]], [parse.QuantifierBlock([1, 2], parse.QuantifierType.FORALL)]
-    )
-    assert result == expected
+import functools
+import re
 
+import pytest
 
-def test_parse_exists_quantifier():
-    """Test parsing exists quantifier."""
-    result = parse.from_qdimacs("p cnf 2 1\ne 1 2 0\n1 2 0")
-    expected = parse.QDimacs(
-        2, [[1, 2]], [parse.QuantifierBlock([1, 2], parse.QuantifierType.EXISTS)]
-    )
-    assert result == expected
-
-
-def test_parse_multiple_quantifier_blocks():
-    """Test parsing multiple quantifier blocks."""
-    result = parse.from_qdimacs("p cnf 4 1\na 1 2 0\ne 3 4 0\n1 2 3 4 0")
-    expected = parse.QDimacs(
-        4,
-        [[1, 2, 3, 4]],
-        [
-            parse.QuantifierBlock([1, 2], parse.QuantifierType.FORALL),
-            parse.QuantifierBlock([3, 4], parse.QuantifierType.EXISTS),
-        ],
+from parse import (
+    QDimacs,
+    QDimacsParseError,
+    QuantifierBlock,
+    QuantifierType,
+    from_qdimacs,
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _qd(num_vars, clauses, quantifiers):
+    """Return a shared expected QDimacs, built from nested tuples."""
+    return QDimacs(
+        num_vars,
+        [list(clause) for clause in clauses],
+        [QuantifierBlock(list(variables), type_) for variables, type_ in quantifiers],
     )
-    assert result == expected
-
-
-def test_invalid_quantifier_variable():
-    """Test parsing quantifier with invalid variable name."""
-    with pytest.raises(parse.QDimacsParseError):
-        parse.from_qdimacs("p cnf 2 1\na abc 0\n1 2 0")
-
 
-def test_empty_quantifier_block():
-    """Test parsing empty quantifier block."""
-    with pytest.raises(parse.QDimacsParseError):
-        parse.from_qdimacs("p cnf 1 1\na 0\n1 0")
 
-
-def test_quantifier_block_whitespace_only():
-    """Test parsing quantifier block with only whitespace."""
-    with pytest.raises(parse.QDimacsParseError):
-        parse.from_qdimacs("p cnf 1 1\na \n1 0")
-
-
-def test_quantifier_block_missing_terminator():
-    """Test parsing quantifier block without 0 terminator."""
-    with pytest.raises(parse.QDimacsParseError):
-        parse.from_qdimacs("p cnf 2 1\na 1 2\n1 2 0")
-
-
-def test_quantifier_block_no_variables():
-    """Test parsing quantifier block with no variables at all."""
-    with pytest.raises(parse.QDimacsParseError):
-        parse.from_qdimacs("p cnf 1 1\na\n1 0")
-
-
-def test_quantifier_block_methods():
-    """Test the QuantifierBlock methods."""
-    forall_block = parse.QuantifierBlock([1, 2], parse.QuantifierType.FORALL)
-    exists_block = parse.QuantifierBlock([3, 4], parse.QuantifierType.EXISTS)
-
-    assert forall_block.is_forall() is True
-    assert forall_block.is_exists() is False
-
-    assert exists_block.is_forall() is False
-    assert exists_block.is_exists() is True
-
-
-def test_tautology():
-    """Test parsing a tautology: ∃x.(x ∨ ¬x)."""
-    qdimacs = """p cnf 1 2
-e 1 0
-1 -1 0"""
-
-    result = parse.from_qdimacs(qdimacs)
-    expected = parse.QDimacs(
-        1, [[1, -1]], [parse.QuantifierBlock([1], parse.QuantifierType.EXISTS)]
+def _fp(qdimacs):
+    """Return a flat, hashable fingerprint of a QDimacs for comparisons."""
+    return (
+        qdimacs.num_vars,
+        tuple(map(tuple, qdimacs.clauses)),
+        tuple(
+            (tuple(block.bound_variables), block.quantifier_type)
+            for block in qdimacs.quantifiers
+        ),
     )
-    assert result == expected
 
 
-def test_qdimacs_str():
-    """Test the parse.QDimacs.__str__ method."""
-    qdimacs = parse.QDimacs(2, [[1, 2], [-1, -2]], [])
-    expected = "p cnf 2 2\n1 2 0\n-1 -2 0"
-    assert str(qdimacs) == expected
+def _assert_raises(src, message):
+    """Assert that parsing src fails with an error matching message."""
+    try:
+        from_qdimacs(src)
+    except QDimacsParseError as e:
+        if message.search(str(e)) is None:
+            pytest.fail(f"expected {message.pattern!r}, got {e!r}")
+    else:
+        pytest.fail(f"expected {message.pattern!r}, got no error")
 
 
-def test_classic_qbf_example():
-    """Test parsing classic QBF example: ∀x.∃y. (x ∨ y) ∧ (¬x ∨ y)."""
-    # This is a classic example from multiple QBF papers
-    qdimacs = """p cnf 2 2
-a 1 0
-e 2 0
-1 2 0
--1 2 0"""
-
-    result = parse.from_qdimacs(qdimacs)
-    expected = parse.QDimacs(
-        2,
-        [[1, 2], [-1, 2]],
-        [
-            parse.QuantifierBlock([1], parse.QuantifierType.FORALL),
-            parse.QuantifierBlock([2], parse.QuantifierType.EXISTS),
-        ],
-    )
-    assert result == expected
-
-
-def test_simple_qbf_example():
-    """Test parsing simple QBF example: ∀x∃y.(x ∨ ¬y)."""
-    qdimacs = """p cnf 2 1
-a 1 0
-e 2 0
-1 -2 0"""
-
-    result = parse.from_qdimacs(qdimacs)
-    expected = parse.QDimacs(
-        2,
-        [[1, -2]],
-        [
-            parse.QuantifierBlock([1], parse.QuantifierType.FORALL),
-            parse.QuantifierBlock([2], parse.QuantifierType.EXISTS),
-        ],
-    )
-    assert result == expected
-
-
-def test_multi_variable_exists_block():
-    """Test parsing QBF with multiple variables in exists block: ∀1∃2∃3 : (1∨2)∧(¬1∨¬2∨3)."""
-    qdimacs = """p cnf 3 2
+# Inputs of POSITIVE_CASES that are too long to be written inline.
+_MULTI_VARIABLE_EXISTS_BLOCK = """p cnf 3 2
 a 1 0
 e 2 3 0
 1 2 0
 -1 -2 3 0"""
 
-    result = parse.from_qdimacs(qdimacs)
-    expected = parse.QDimacs(
-        3,
-        [[1, 2], [-1, -2, 3]],
-        [
-            parse.QuantifierBlock([1], parse.QuantifierType.FORALL),
-            parse.QuantifierBlock([2, 3], parse.QuantifierType.EXISTS),
-        ],
-    )
-    assert result == expected
-
-
-def test_alternating_quantifiers():
-    """Test alternating quantifier pattern: ∀1∃2∀3∃4."""
-    qdimacs = """p cnf 4 2
+_ALTERNATING_QUANTIFIERS = """p cnf 4 2
 a 1 0
 e 2 0
 a 3 0
@@ -264,44 +62,14 @@ e 4 0
 1 2 3 0
 -1 -3 4 0"""
 
-    result = parse.from_qdimacs(qdimacs)
-    expected = parse.QDimacs(
-        4,
-        [[1, 2, 3], [-1, -3, 4]],
-        [
-            parse.QuantifierBlock([1], parse.QuantifierType.FORALL),
-            parse.QuantifierBlock([2], parse.QuantifierType.EXISTS),
-            parse.QuantifierBlock([3], parse.QuantifierType.FORALL),
-            parse.QuantifierBlock([4], parse.QuantifierType.EXISTS),
-        ],
-    )
-    assert result == expected
-
-
-def test_multiple_variables_per_quantifier_block():
-    """Test quantifier blocks with multiple variables each."""
-    qdimacs = """p cnf 6 3
+_MULTIPLE_VARIABLES_PER_QUANTIFIER_BLOCK = """p cnf 6 3
 a 1 2 3 0
 e 4 5 6 0
 1 4 0
 2 5 0
 3 6 0"""
 
-    result = parse.from_qdimacs(qdimacs)
-    expected = parse.QDimacs(
-        6,
-        [[1, 4], [2, 5], [3, 6]],
-        [
-            parse.QuantifierBlock([1, 2, 3], parse.QuantifierType.FORALL),
-            parse.QuantifierBlock([4, 5, 6], parse.QuantifierType.EXISTS),
-        ],
-    )
-    assert result == expected
-
-
-def test_larger_formula_with_comments():
-    """Test parsing larger QDIMACS formula with 5 variables and comments."""
-    qdimacs = """c This is a comment
+_LARGER_FORMULA_WITH_COMMENTS = """c This is a comment
 c Another comment line
 p cnf 5 4
 a 1 2 0
@@ -311,21 +79,7 @@ e 3 4 5 0
 -1 -2 5 0
 3 -4 -5 0"""
 
-    result = parse.from_qdimacs(qdimacs)
-    expected = parse.QDimacs(
-        5,
-        [[1, 3], [2, 4], [-1, -2, 5], [3, -4, -5]],
-        [
-            parse.QuantifierBlock([1, 2], parse.QuantifierType.FORALL),
-            parse.QuantifierBlock([3, 4, 5], parse.QuantifierType.EXISTS),
-        ],
-    )
-    assert result == expected
-
-
-def test_interspersed_comments():
-    """Test parsing QDIMACS with comments interspersed between quantifiers and clauses."""
-    qdimacs = """c QBF example from research
+_INTERSPERSED_COMMENTS = """c QBF example from research
 c Formula: ∀x∃y.(x ∨ y) ∧ (¬x ∨ y)
 p cnf 2 2
 c Quantifier block for x
@@ -338,87 +92,310 @@ c Second clause: ¬x ∨ y
 -1 2 0
 c End of formula"""
 
-    result = parse.from_qdimacs(qdimacs)
-    expected = parse.QDimacs(
-        2,
-        [[1, 2], [-1, 2]],
-        [
-            parse.QuantifierBlock([1], parse.QuantifierType.FORALL),
-            parse.QuantifierBlock([2], parse.QuantifierType.EXISTS),
-        ],
-    )
-    assert result == expected
-
-
-def test_classical_sat_formula():
-    """Test parsing a classical SAT formula (DIMACS without quantifiers)."""
-    # This is a simple satisfiable SAT formula: just x
-    # Classical DIMACS files don't have quantifier blocks
-    qdimacs = """p cnf 1 1
-1 0"""
+_ANOTHER_SATISFIABLE_QBF = """p cnf 2 1
+e 1 0
+a 2 0
+1 2 0"""
 
-    result = parse.from_qdimacs(qdimacs)
-    expected = parse.QDimacs(1, [[1]], [])  # No quantifiers in classical SAT
-    assert result == expected
+# Valid inputs and their expected parse results.
+POSITIVE_CASES = [
+    pytest.param("p cnf 1 0", _qd(1, (), ()), id="header"),
+    pytest.param("c\np cnf 1 0", _qd(1, (), ()), id="leading-comment"),
+    pytest.param("c\np cnf 1 0\nc", _qd(1, (), ()), id="trailing-comment"),
+    pytest.param("p cnf 1 1\n1 0", _qd(1, ((1,),), ()), id="unit-clause"),
+    pytest.param("p cnf 1 2\n1 0\n-1 0", _qd(1, ((1,), (-1,)), ()), id="unit-clauses"),
+    pytest.param("p cnf 2 2\n1 2 0\n-1 0", _qd(2, ((1, 2), (-1,)), ()), id="clauses"),
+    # ∃x.(x ∨ ¬x)
+    pytest.param(
+        "p cnf 1 2\ne 1 0\n1 -1 0",
+        _qd(1, ((1, -1),), (((1,), QuantifierType.EXISTS),)),
+        id="tautology",
+    ),
+    # ∀x.∃y. (x ∨ y) ∧ (¬x ∨ y), a classic example from multiple QBF papers
+    pytest.param(
+        "p cnf 2 2\na 1 0\ne 2 0\n1 2 0\n-1 2 0",
+        _qd(
+            2,
+            ((1, 2), (-1, 2)),
+            (((1,), QuantifierType.FORALL), ((2,), QuantifierType.EXISTS)),
+        ),
+        id="classic-qbf",
+    ),
+    # ∀x∃y.(x ∨ ¬y)
+    pytest.param(
+        "p cnf 2 1\na 1 0\ne 2 0\n1 -2 0",
+        _qd(
+            2,
+            ((1, -2),),
+            (((1,), QuantifierType.FORALL), ((2,), QuantifierType.EXISTS)),
+        ),
+        id="simple-qbf",
+    ),
+    # (x1 ∨ x2) ∧ (¬x1 ∨ x2)
+    pytest.param(
+        "p cnf 2 2\n1 2 0\n-1 2 0",
+        _qd(2, ((1, 2), (-1, 2)), ()),
+        id="sat-two-vars",
+    ),
+    # ∃x.x ∧ ¬x, which is unsatisfiable
+    pytest.param(
+        "p cnf 1 2\ne 1 0\n1 0\n-1 0",
+        _qd(1, ((1,), (-1,)), (((1,), QuantifierType.EXISTS),)),
+        id="exists-contradiction",
+    ),
+    # Clauses are terminated by 0 rather than by line breaks.
+    pytest.param(
+        "p cnf 2 2\n1 0 -1 2 0",
+        _qd(2, ((1,), (-1, 2)), ()),
+        id="across-lines-1",
+    ),
+    pytest.param("p cnf 2 1\n1\n2 0", _qd(2, ((1, 2),), ()), id="across-lines-2"),
+    pytest.param(
+        "p cnf 2 1\na 1 2 0\n1 2 0",
+        _qd(2, ((1, 2),), (((1, 2), QuantifierType.FORALL),)),
+        id="forall-quantifier",
+    ),
+    pytest.param(
+        "p cnf 2 1\ne 1 2 0\n1 2 0",
+        _qd(2, ((1, 2),), (((1, 2), QuantifierType.EXISTS),)),
+        id="exists-quantifier",
+    ),
+    pytest.param(
+        "p cnf 4 1\na 1 2 0\ne 3 4 0\n1 2 3 4 0",
+        _qd(
+            4,
+            ((1, 2, 3, 4),),
+            (
+                ((1, 2), QuantifierType.FORALL),
+                ((3, 4), QuantifierType.EXISTS),
+            ),
+        ),
+        id="two-blocks",
+    ),
+    # ∀1∃2∃3 : (1∨2)∧(¬1∨¬2∨3)
+    pytest.param(
+        _MULTI_VARIABLE_EXISTS_BLOCK,
+        _qd(
+            3,
+            ((1, 2), (-1, -2, 3)),
+            (
+                ((1,), QuantifierType.FORALL),
+                ((2, 3), QuantifierType.EXISTS),
+            ),
+        ),
+        id="multi-var-exists",
+    ),
+    # Alternating quantifiers: ∀1∃2∀3∃4
+    pytest.param(
+        _ALTERNATING_QUANTIFIERS,
+        _qd(
+            4,
+            ((1, 2, 3), (-1, -3, 4)),
+            (
+                ((1,), QuantifierType.FORALL),
+                ((2,), QuantifierType.EXISTS),
+                ((3,), QuantifierType.FORALL),
+                ((4,), QuantifierType.EXISTS),
+            ),
+        ),
+        id="alternating-quantifiers",
+    ),
+    pytest.param(
+        _MULTIPLE_VARIABLES_PER_QUANTIFIER_BLOCK,
+        _qd(
+            6,
+            ((1, 4), (2, 5), (3, 6)),
+            (
+                ((1, 2, 3), QuantifierType.FORALL),
+                ((4, 5, 6), QuantifierType.EXISTS),
+            ),
+        ),
+        id="multi-var-blocks",
+    ),
+    pytest.param(
+        _LARGER_FORMULA_WITH_COMMENTS,
+        _qd(
+            5,
+            ((1, 3), (2, 4), (-1, -2, 5), (3, -4, -5)),
+            (
+                ((1, 2), QuantifierType.FORALL),
+                ((3, 4, 5), QuantifierType.EXISTS),
+            ),
+        ),
+        id="comments-5-vars",
+    ),
+    # Comments interspersed between quantifiers and clauses
+    pytest.param(
+        _INTERSPERSED_COMMENTS,
+        _qd(
+            2,
+            ((1, 2), (-1, 2)),
+            (((1,), QuantifierType.FORALL), ((2,), QuantifierType.EXISTS)),
+        ),
+        id="comments-between",
+    ),
+    # ∃x∀y.(x ∨ y)
+    pytest.param(
+        _ANOTHER_SATISFIABLE_QBF,
+        _qd(
+            2,
+            ((1, 2),),
+            (((1,), QuantifierType.EXISTS), ((2,), QuantifierType.FORALL)),
+        ),
+        id="exists-forall",
+    ),
+]
+
+# Expected error messages, compiled once for pytest.raises(match=...).
+_EMPTY_FILE = re.compile("^Empty file$")
+_INVALID_HEADER = re.compile("^Invalid header$")
+_ONLY_CNF = re.compile("^Only cnf format is supported$")
+_INVALID_NUM_VARS = re.compile("^Invalid number of variables$")
+_INVALID_NUM_CLAUSES = re.compile("^Invalid number of clauses$")
+_CLAUSE_TERMINATOR = re.compile("^Clauses must end with 0$")
+_INVALID_LITERAL = re.compile("^Invalid literal$")
+_EMPTY_CLAUSE = re.compile("^Empty clause$")
+_OUT_OF_RANGE = re.compile("^Variable out of range$")
+_DUPLICATE_CLAUSE = re.compile("^Duplicate clause$")
+_INVALID_QUANTIFIER = re.compile("^Invalid quantifier$")
+_QUANTIFIER_AFTER_CLAUSES = re.compile("^Quantifier block after clauses$")
+_ZERO_IN_BLOCK = re.compile("^Quantifier blocks must not contain 0$")
+_EMPTY_BLOCK = re.compile("^Empty quantifier block$")
+_BLOCK_TERMINATOR = re.compile("^Quantifier blocks must end with 0$")
+
+INVALID_HEADERS = (
+    pytest.param("", _EMPTY_FILE, id="empty"),
+    pytest.param("c", _EMPTY_FILE, id="comment-only"),
+    pytest.param("p", _ONLY_CNF, id="p-only"),
+    pytest.param("p cnf", _INVALID_HEADER, id="no-counts"),
+    pytest.param("p cnf 0", _INVALID_HEADER, id="one-count-0"),
+    pytest.param("p cnf 1", _INVALID_HEADER, id="one-count-1"),
+    pytest.param("q cnf 1 1", _INVALID_HEADER, id="bad-prefix"),
+    pytest.param("p sat 1 1", _ONLY_CNF, id="not-cnf"),
+    pytest.param("p cnf a 1", _INVALID_HEADER, id="vars-nan"),
+    pytest.param("p cnf 1 a", _INVALID_HEADER, id="clauses-nan"),
+    pytest.param("p cnf 0 1", _INVALID_NUM_VARS, id="zero-vars"),
+    pytest.param("p cnf 1 -1", _INVALID_NUM_CLAUSES, id="negative-clauses"),
+)
+
+INVALID_CLAUSES = (
+    pytest.param("p cnf 1 1\n1", _CLAUSE_TERMINATOR, id="no-terminator"),
+    pytest.param("p cnf 1 1\n1 x 0", _INVALID_LITERAL, id="bad-literal"),
+    # Lines starting with "a" are quantifier blocks.
+    pytest.param("p cnf 1 1\nabc 0", _INVALID_QUANTIFIER, id="quantifier-like"),
+    pytest.param("p cnf 1 1\n0", _EMPTY_CLAUSE, id="empty-clause"),
+    pytest.param("p cnf 1 1\n 0", _EMPTY_CLAUSE, id="empty-after-space"),
+    pytest.param("p cnf 1 1\n0 1 0", _EMPTY_CLAUSE, id="leading-zero"),
+    # 0 ends a clause, so this is a second clause, with a variable out of range
+    pytest.param("p cnf 1 1\n1 0 2 0", _OUT_OF_RANGE, id="second-out-of-range"),
+    pytest.param("p cnf 1 1\n2 0", _OUT_OF_RANGE, id="out-of-range"),
+    pytest.param("p cnf 1 2\n1 0\n1 0", _DUPLICATE_CLAUSE, id="duplicate"),
+    pytest.param(
+        "p cnf 2 2\n1 2 0\n2 1 0", _DUPLICATE_CLAUSE, id="duplicate-reordered"
+    ),
+)
+
+INVALID_QUANT_INPUTS = (
+    pytest.param("p cnf 2 1\na abc 0\n1 2 0", _INVALID_QUANTIFIER, id="bad-variable"),
+    pytest.param("p cnf 2 1\na 1 0 2 0\n1 2 0", _ZERO_IN_BLOCK, id="zero-in-block"),
+    pytest.param("p cnf 2 1\na 3 0\n1 2 0", _OUT_OF_RANGE, id="out-of-range"),
+    pytest.param("p cnf 2 1\na -1 0\n1 2 0", _OUT_OF_RANGE, id="negative-variable"),
+    pytest.param("p cnf 1 1\na 0\n1 0", _EMPTY_BLOCK, id="empty-block"),
+    pytest.param("p cnf 1 1\na \n1 0", _BLOCK_TERMINATOR, id="whitespace-block"),
+    pytest.param("p cnf 2 1\na 1 2\n1 2 0", _BLOCK_TERMINATOR, id="no-terminator"),
+    pytest.param("p cnf 1 1\na\n1 0", _BLOCK_TERMINATOR, id="no-variables"),
+    # The prefix ends at the first clause.
+    pytest.param(
+        "p cnf 2 1\n1 2 0\na 1 0", _QUANTIFIER_AFTER_CLAUSES, id="after-clauses"
+    ),
+)
+
+
+@pytest.mark.parser_positive
+@pytest.mark.parametrize("src,expected", POSITIVE_CASES)
+def test_parse_valid(src, expected):
+    """Test parsing valid QDIMACS inputs."""
+    assert _fp(from_qdimacs(src)) == _fp(expected)
+
+
+@pytest.mark.parser_negative
+def test_parse_error():
+    """Test that parse errors propagate as QDimacsParseError."""
+    with pytest.raises(QDimacsParseError, match=_EMPTY_FILE):
+        from_qdimacs("")
+
+
+@pytest.mark.parser_negative
+@pytest.mark.parametrize("src,message", INVALID_HEADERS)
+def test_parse_header_raises(src, message):
+    """Test that invalid or missing headers are rejected."""
+    _assert_raises(src, message)
+
+
+@pytest.mark.parser_negative
+@pytest.mark.parametrize("src,message", INVALID_CLAUSES)
+def test_parse_invalid_clauses(src, message):
+    """Test that invalid clauses are rejected."""
+    _assert_raises(src, message)
+
+
+@pytest.mark.parser_negative
+@pytest.mark.parser_quantifier
+@pytest.mark.parametrize("src,message", INVALID_QUANT_INPUTS)
+def test_parse_invalid_quantifiers(src, message):
+    """Test that invalid quantifier blocks are rejected."""
+    _assert_raises(src, message)
+
+
+@pytest.mark.parser_quantifier
+def test_quantifier_block_methods():
+    """Test the QuantifierBlock methods."""
+    forall_block = QuantifierBlock([1, 2], QuantifierType.FORALL)
+    exists_block = QuantifierBlock([3, 4], QuantifierType.EXISTS)
 
+    assert forall_block.is_forall() is True
+    assert forall_block.is_exists() is False
 
-def test_classical_sat_unsatisfiable():
-    """Test parsing an unsatisfiable classical SAT formula."""
-    # This is unsatisfiable: x AND NOT x
-    qdimacs = """p cnf 1 2
-1 0
--1 0"""
+    assert exists_block.is_forall() is False
+    assert exists_block.is_exists() is True
 
-    result = parse.from_qdimacs(qdimacs)
-    expected = parse.QDimacs(1, [[1], [-1]], [])  # No quantifiers in classical SAT
-    assert result == expected
 
+def test_qdimacs_str():
+    """Test the QDimacs.__str__ method."""
+    qdimacs = QDimacs(2, [[1, 2], [-1, -2]], [])
+    expected = "p cnf 2 2\n1 2 0\n-1 -2 0"
+    assert str(qdimacs) == expected
 
-def test_classical_sat_multiple_variables():
-    """Test parsing classical SAT formula with multiple variables."""
-    # (x1 OR x2) AND (NOT x1 OR x2) - satisfiable by setting x2=true
-    qdimacs = """p cnf 2 2
-1 2 0
--1 2 0"""
 
-    result = parse.from_qdimacs(qdimacs)
-    expected = parse.QDimacs(
-        2, [[1, 2], [-1, 2]], []  # No quantifiers in classical SAT
-    )
-    assert result == expected
+@pytest.mark.parser_positive
+@pytest.mark.parametrize("newline", ["\r", "\r\n"])
+def test_parse_line_endings(newline):
+    """Test that carriage return line endings are accepted."""
+    qdimacs = "c comment\np cnf 2 2\na 1 0\ne 2 0\nc comment\n1 2 0\n-1 2 0\n"
+    expected = from_qdimacs(qdimacs)
+    converted = qdimacs.replace("\n", newline)
+    assert from_qdimacs(converted) == expected
+    assert from_qdimacs(converted.encode()) == expected
 
 
-def test_satisfiable_qbf_formula():
-    """Test parsing a satisfiable QBF formula: ∃x.(x ∨ ¬x)."""
-    # This is a simple tautology that should be satisfiable
-    # ∃x.(x ∨ ¬x) is always true regardless of x's value
-    qdimacs = """p cnf 1 2
-e 1 0
-1 0
--1 0"""
+def test_parse_bytes():
+    """Test that parsing bytes gives the same result as parsing a string."""
+    qdimacs = "c comment\np cnf 3 2\na 1 0\ne 2 3 0\nc comment\n1 -2 0\n2 3 0\n"
+    assert from_qdimacs(qdimacs.encode()) == from_qdimacs(qdimacs)
 
-    result = parse.from_qdimacs(qdimacs)
-    expected = parse.QDimacs(
-        1, [[1], [-1]], [parse.QuantifierBlock([1], parse.QuantifierType.EXISTS)]
-    )
-    assert result == expected
 
+@pytest.mark.parser_quantifier
+def test_prefix():
+    """Test that prefix returns the quantifier blocks as tagged pairs."""
+    qdimacs = from_qdimacs("p cnf 3 1\na 1 0\ne 2 3 0\n1 2 0")
+    assert qdimacs.prefix() == [(True, [1]), (False, [2, 3])]
 
-def test_another_satisfiable_qbf():
-    """Test parsing another satisfiable QBF: ∃x∀y.(x ∨ y)."""
-    # This formula is satisfiable: if we set x=true, then (x ∨ y) is true for any y
-    qdimacs = """p cnf 2 1
-e 1 0
-a 2 0
-1 2 0"""
 
-    result = parse.from_qdimacs(qdimacs)
-    expected = parse.QDimacs(
-        2,
-        [[1, 2]],
-        [
-            parse.QuantifierBlock([1], parse.QuantifierType.EXISTS),
-            parse.QuantifierBlock([2], parse.QuantifierType.FORALL),
-        ],
-    )
-    assert result == expected
+@pytest.mark.parser_quantifier
+def test_quantifier_block_from_string():
+    """Test that quantifier blocks accept the quantifier type's value."""
+    block = QuantifierBlock([1, 2], "forall")
+    assert block.is_forall()
+    assert block == QuantifierBlock([1, 2], QuantifierType.FORALL)
+    with pytest.raises(ValueError):
+        QuantifierBlock([1], "some")